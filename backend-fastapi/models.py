@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import uuid
 
@@ -104,12 +104,12 @@ class Answer(BaseModel):
     questionType: QuestionType
     answer: Any
     metadata: Dict[str, Any] = {}
-    answeredAt: datetime = Field(default_factory=datetime.utcnow)
+    answeredAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 class ResponseMetadata(BaseModel):
     sessionId: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    startedAt: datetime = Field(default_factory=datetime.utcnow)
+    startedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     submittedAt: Optional[datetime] = None
     lastModifiedAt: Optional[datetime] = None
     ipAddress: Optional[str] = None
@@ -158,6 +158,11 @@ class DateRange(BaseModel):
     start: datetime
     end: datetime
 
+    @property
+    def iso(self) -> tuple:
+        """ISO-formatted (start, end) pair for backend query params"""
+        return self.start.isoformat(), self.end.isoformat()
+
 
 class ResponseStats(BaseModel):
     total: int = 0
@@ -203,7 +208,7 @@ class QualityMetrics(BaseModel):
 
 
 class AIInsights(BaseModel):
-    generatedAt: datetime = Field(default_factory=datetime.utcnow)
+    generatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     summary: str
     keyFindings: List[str] = []
     recommendations: List[str] = []
@@ -224,8 +229,8 @@ class AnalyticsResponse(BaseModel):
     reportType: str = "custom"
     generatedBy: Optional[str] = None
     isPublic: bool = False
-    lastUpdated: datetime = Field(default_factory=datetime.utcnow)
-    createdAt: datetime = Field(default_factory=datetime.utcnow)
+    lastUpdated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # Export Models
@@ -302,7 +307,7 @@ class ValidationErrorResponse(ErrorResponse):
 # Health Check
 class HealthResponse(BaseModel):
     status: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     version: str = "1.0.0"
     services: Dict[str, Any] = {}
 
@@ -313,4 +318,4 @@ class FileUploadResponse(BaseModel):
     url: str
     size: int
     mimeType: str
-    uploadedAt: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    uploadedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""arq worker for durable background jobs.
+
+Jobs enqueued by the FastAPI service survive worker crashes and
+redeploys because they live in Redis until acknowledged. Run with:
+
+    arq worker.WorkerSettings
+"""
+import os
+
+import aiohttp
+import orjson
+from arq.connections import RedisSettings
+
+NODE_BACKEND_URL = os.getenv("NODE_BACKEND_URL", "http://localhost:5000")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+
+
+async def startup(ctx):
+    """Create the shared HTTP session for the worker process"""
+    ctx["http_client"] = aiohttp.ClientSession(
+        base_url=NODE_BACKEND_URL,
+        timeout=aiohttp.ClientTimeout(total=30, connect=5),
+        json_serialize=lambda obj: orjson.dumps(obj).decode()
+    )
+
+
+async def shutdown(ctx):
+    await ctx["http_client"].close()
+
+
+async def save_insights(ctx, questionnaire_id, insights):
+    """Persist generated insights to the Node.js backend"""
+    async with ctx["http_client"].post(
+        f"/api/questionnaires/{questionnaire_id}/insights",
+        json=insights,
+        headers={"Content-Type": "application/json"}
+    ):
+        pass
+
+
+class WorkerSettings:
+    functions = [save_insights]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(REDIS_URL)
+    max_tries = 5